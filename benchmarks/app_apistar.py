@@ -1,13 +1,15 @@
 from apistar import App, Route
 from apistar.http import JSONResponse, RequestData
 
+GREETING = "Hi %s! I hear you're %s years old."
+
 
 def index() -> dict:
     return {"message": "hello!"}
 
 
 def hello(name: str, age: int) -> JSONResponse:
-    return JSONResponse(f"Hi {name}! I hear you're {age} years old.")
+    return JSONResponse(GREETING % (name, age))
 
 
 def echo(data: RequestData) -> dict:
@@ -1,5 +1,7 @@
 from falcon import API
 
+GREETING = "Hi %s! I hear you're %s years old."
+
 
 class Index:
     def on_get(self, req, resp):
@@ -8,7 +10,7 @@ class Index:
 
 class Hello:
     def on_get(self, req, resp, name, age):
-        resp.media = f"Hi {name}! I hear you're {age} years old."
+        resp.media = GREETING % (name, age)
 
 
 class Echo:
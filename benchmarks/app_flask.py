@@ -1,5 +1,7 @@
 from flask import Flask, jsonify, request
 
+GREETING = "Hi %s! I hear you're %s years old."
+
 app = Flask(__name__)
 
 
@@ -10,7 +12,7 @@ def index():
 
 @app.route("/hello/<name>/<int:age>")
 def hello(name, age):
-    return jsonify(f"Hi {name}! I hear you're {age} years old.")
+    return jsonify(GREETING % (name, age))
 
 
 @app.route("/echo", methods=["POST"])
@@ -1,12 +1,14 @@
 from molten import App, RequestData, Route
 
+GREETING = "Hi %s! I hear you're %s years old."
+
 
 def index() -> dict:
     return {"message": "hello!"}
 
 
 def hello(name: str, age: int) -> str:
-    return f"Hi {name}! I hear you're {age} years old."
+    return GREETING % (name, age)
 
 
 def echo(data: RequestData) -> dict:
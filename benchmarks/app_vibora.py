@@ -1,6 +1,8 @@
 from vibora import Request, Vibora
 from vibora.responses import JsonResponse
 
+GREETING = "Hi %s! I hear you're %s years old."
+
 app = Vibora()
 
 
@@ -11,7 +13,7 @@ async def index() -> JsonResponse:
 
 @app.route("/hello/<name>/<age>")
 async def hello(name: str, age: int) -> JsonResponse:
-    return JsonResponse(f"Hi {name}! I hear you're {age} years old.")
+    return JsonResponse(GREETING % (name, age))
 
 
 @app.route("/echo", methods=["POST"])
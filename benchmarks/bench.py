@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import itertools
 import json
 import math
 import random
@@ -9,11 +10,23 @@ import time
 from collections import Counter
 
 import aiohttp
+import numpy as np
 import uvloop
+import yarl
 
-asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 random.seed(1337)
 
+BASE_URL = "http://127.0.0.1:8000"
+QUANTILES = (50, 75, 90, 95, 99)
+
+URL_INDEX = yarl.URL(BASE_URL + "/")
+URL_404 = yarl.URL(BASE_URL + "/idontexist")
+URL_HELLO = yarl.URL(BASE_URL + "/hello/Jim/24")
+URL_ECHO = yarl.URL(BASE_URL + "/echo")
+
+JSON_HEADERS = {"content-type": "application/json"}
+JSON_PAYLOAD = json.dumps({"nested": {"example": {"array": [1, 2, 3]}}}).encode()
+
 
 def shell(cmd, *, timeout=120, **opts):
     if not opts:
@@ -34,7 +47,25 @@ def stop_container(name):
     return shell(f"docker kill bench_{name}")
 
 
+CGROUP_MEMORY_PATHS = [
+    "/sys/fs/cgroup/system.slice/docker-{container_id}.scope/memory.current",
+    "/sys/fs/cgroup/memory/docker/{container_id}/memory.usage_in_bytes",
+]
+
+
 def get_container_memory_usage(name):
+    # Reading the container's cgroup directly is instantaneous whereas
+    # "docker stats" samples for a couple of seconds.  The cgroup files
+    # are only available when the Docker daemon runs on this host.
+    res = shell(f"docker inspect -f '{{{{.Id}}}}' bench_{name}", capture_output=True)
+    container_id = res.stdout.strip().decode()
+    for path in CGROUP_MEMORY_PATHS:
+        try:
+            with open(path.format(container_id=container_id)) as f:
+                return f"{int(f.read()) / 1024 / 1024:.2f}MiB"
+        except (OSError, ValueError):
+            continue
+
     res = shell(f"docker stats --format '{{{{.MemUsage}}}}' --no-stream bench_{name}", capture_output=True)
     memory_usage = res.stdout.strip().decode()
     current, _, _ = memory_usage.partition("/")
@@ -42,42 +73,42 @@ def get_container_memory_usage(name):
 
 
 async def get_index(session):
-    async with session.get("http://127.1:8000") as response:
-        await response.text()
+    async with session.get(URL_INDEX) as response:
+        await response.read()
 
 
 async def get_404(session):
-    async with session.get("http://127.1:8000/idontexist") as response:
-        await response.text()
+    async with session.get(URL_404) as response:
+        await response.read()
 
 
 async def get_hello(session):
-    async with session.get("http://127.1:8000/hello/Jim/24") as response:
-        await response.text()
+    async with session.get(URL_HELLO) as response:
+        await response.read()
 
 
 async def post_json(session):
-    payload = {"nested": {"example": {"array": [1, 2, 3]}}}
-    async with session.post("http://127.1:8000/echo", json=payload) as response:
-        await response.text()
+    async with session.post(URL_ECHO, data=JSON_PAYLOAD, headers=JSON_HEADERS) as response:
+        await response.read()
 
 
-TASKS = [
-    *([get_index] * 100),
-    *([post_json] * 50),
-    *([get_hello] * 30),
-    *([get_404] * 1),
-]
-random.shuffle(TASKS)
+TASKS = [get_index, post_json, get_hello, get_404]
+TASK_WEIGHTS = [100, 50, 30, 1]
 
+# The task schedule is precomputed so that picking the next task is a
+# plain tuple lookup rather than a call into the RNG.  Its size is a
+# power of two so that wrapping around is a cheap bitmask.
+SCHEDULE_SIZE = 2 ** 20
+SCHEDULE = tuple(random.choices(TASKS, weights=TASK_WEIGHTS, k=SCHEDULE_SIZE))
+SCHEDULE_COUNTER = itertools.count()
 
-async def do_bench(session):
-    start_time = time.monotonic()
-    res, task_name = "n/a", None
+
+async def do_bench(session, loop):
+    task = SCHEDULE[next(SCHEDULE_COUNTER) & (SCHEDULE_SIZE - 1)]
+    res, task_name = "n/a", task.__name__
+    start_time = loop.time()
 
     try:
-        task = random.choice(TASKS)
-        task_name = task.__name__
         await task(session)
         res = "ok"
 
@@ -85,56 +116,81 @@ async def do_bench(session):
         res = "err"
 
     finally:
-        return res, task_name, time.monotonic() - start_time
+        return res, task_name, loop.time() - start_time
 
 
 async def benchmark(name, duration=30, concurrency=50, warmup=1000):
-    async with aiohttp.ClientSession() as session:
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=concurrency * 2,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+
+    loop = asyncio.get_running_loop()
+    session_options = dict(
+        connector=connector,
+        connector_owner=True,
+        read_bufsize=65536,
+        skip_auto_headers=("User-Agent",),
+    )
+
+    async with aiohttp.ClientSession(**session_options) as session:
         print("Warming up...", file=sys.stderr)
-        for _ in range(warmup):
-            await do_bench(session)
+        warmup_semaphore = asyncio.Semaphore(concurrency)
+
+        async def do_warmup():
+            async with warmup_semaphore:
+                await do_bench(session, loop)
+
+        # Warm up with as many concurrent requests as the benchmark
+        # itself uses so that the connection pool is fully primed.
+        await asyncio.gather(*(do_warmup() for _ in range(warmup)))
 
         print("Benchmarking...", file=sys.stderr)
         start_time = time.monotonic()
         deadline = time.monotonic() + duration
+        semaphore = asyncio.Semaphore(concurrency)
         pending_tasks, results = set(), []
-        while time.monotonic() < deadline:
-            if len(pending_tasks) < concurrency:
-                pending_tasks.add(asyncio.ensure_future(do_bench(session)))
 
-            else:
-                done_tasks, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-                results.extend(t.result() for t in done_tasks)
+        def on_done(task):
+            pending_tasks.discard(task)
+            results.append(task.result())
+            semaphore.release()
 
-        done_tasks, _ = await asyncio.wait(pending_tasks)
-        results.extend(t.result() for t in done_tasks)
+        while time.monotonic() < deadline:
+            await semaphore.acquire()
+            task = asyncio.ensure_future(do_bench(session, loop))
+            task.add_done_callback(on_done)
+            pending_tasks.add(task)
 
-        duration = time.monotonic() - start_time
-        minimum, maximum, total, errors = float("inf"), float("-inf"), 0, 0
-        for res, _, req_duration in results:
-            minimum = min(minimum, req_duration)
-            maximum = max(maximum, req_duration)
-            errors += 1 if res == "err" else 0
-            total += req_duration
+        if pending_tasks:
+            await asyncio.gather(*pending_tasks)
 
-        tasks = Counter(t for _, t, _ in results)
-        durations = sorted(d for _, _, d in results)
+        duration = time.monotonic() - start_time
+        statuses, task_names, durations = zip(*results)
+        errors = statuses.count("err")
+        tasks = Counter(task_names)
+        durations = np.array(durations, dtype=np.float64)
 
-        def qtile(n):
-            return durations[math.ceil(len(results) * n / 100)]
+        # Only a handful of quantiles are reported so partitioning the
+        # durations around their indices is enough; no full sort needed.
+        indices = [min(math.ceil(len(results) * n / 100), len(results) - 1) for n in QUANTILES]
+        quantiles = dict(zip(QUANTILES, np.partition(durations, indices)[indices]))
 
         print(json.dumps({
             "memory_usage": get_container_memory_usage(name),
             "duration": f"{duration:.02f}s",
             "qps": f"{len(results) / duration:0.2f}",
-            "minimum": f"{minimum * 1000:.02f}ms",
-            "maximum": f"{maximum * 1000:.02f}ms",
-            "average": f"{total / len(results) * 1000:.02f}ms",
-            "p99": f"{qtile(99) * 1000:.02f}ms",
-            "p95": f"{qtile(95) * 1000:.02f}ms",
-            "p90": f"{qtile(90) * 1000:.02f}ms",
-            "p75": f"{qtile(75) * 1000:.02f}ms",
-            "p50": f"{qtile(50) * 1000:.02f}ms",
+            "minimum": f"{durations.min() * 1000:.02f}ms",
+            "maximum": f"{durations.max() * 1000:.02f}ms",
+            "average": f"{durations.sum() / len(results) * 1000:.02f}ms",
+            "p99": f"{quantiles[99] * 1000:.02f}ms",
+            "p95": f"{quantiles[95] * 1000:.02f}ms",
+            "p90": f"{quantiles[90] * 1000:.02f}ms",
+            "p75": f"{quantiles[75] * 1000:.02f}ms",
+            "p50": f"{quantiles[50] * 1000:.02f}ms",
             "requests": len(results),
             "errors": errors,
             "tasks": dict(tasks),
@@ -157,8 +213,7 @@ def main():
     time.sleep(3)
 
     try:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(benchmark(
+        uvloop.run(benchmark(
             name=args.framework,
             duration=args.duration,
             concurrency=args.concurrency,
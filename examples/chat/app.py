@@ -1,14 +1,14 @@
 import json
-from queue import Empty, Queue
-from typing import Dict
+from collections import deque
+from itertools import count, takewhile
+from threading import Condition
+from typing import Deque, Set, Tuple
 
 from molten import (
     HTTP_200, HTTP_204, HTTP_404, App, Field, HTTPError, Response, Route, StreamingResponse,
     dump_schema, schema
 )
 
-MAILBOXES: Dict[str, Queue] = {}
-
 
 @schema
 class Envelope:
@@ -17,32 +17,55 @@ class Envelope:
     recipient: str = Field(request_only=True, default="*")
 
 
+#: Every envelope is appended to this log exactly once, regardless of
+#: how many users it's addressed to.  Listeners keep track of their own
+#: position in the log and pick out the envelopes meant for them.
+LOG: Deque[Tuple[int, Envelope]] = deque(maxlen=1024)
+LOG_CONDITION = Condition()
+LOG_SEQUENCE = count()
+USERNAMES: Set[str] = set()
+
+
 def send_envelope(envelope: Envelope) -> Response:
-    if envelope.recipient != "*":
-        try:
-            MAILBOXES[envelope.recipient].put(envelope)
-        except KeyError:
-            raise HTTPError(HTTP_404, {"error": f"user {envelope.recipient} not found"})
+    if envelope.recipient != "*" and envelope.recipient not in USERNAMES:
+        raise HTTPError(HTTP_404, {"error": f"user {envelope.recipient} not found"})
 
-    else:
-        for mailbox in MAILBOXES.values():
-            mailbox.put(envelope)
+    with LOG_CONDITION:
+        LOG.append((next(LOG_SEQUENCE), envelope))
+        LOG_CONDITION.notify_all()
 
     return Response(HTTP_204)
 
 
 def receive_envelopes(username: str) -> StreamingResponse:
-    MAILBOXES[username] = mailbox = Queue()  # type: ignore
+    USERNAMES.add(username)
+    with LOG_CONDITION:
+        cursor = LOG[-1][0] if LOG else -1
 
     def listen():
+        nonlocal cursor
         while True:
-            try:
-                envelope = mailbox.get(timeout=30)
-                message = {"type": "envelope", "content": dump_schema(envelope)}
-            except Empty:
-                message = {"type": "heartbeat"}
+            with LOG_CONDITION:
+                if not LOG_CONDITION.wait_for(lambda: LOG and LOG[-1][0] > cursor, timeout=30):
+                    yield json.dumps({"type": "heartbeat"}).encode() + b"\n"
+                    continue
+
+                entries = list(takewhile(lambda entry: entry[0] > cursor, reversed(LOG)))
+
+                # When a listener falls more than a full log behind, the
+                # envelopes right after its cursor have been evicted.
+                # Tell the client how many it missed so it can resync
+                # rather than dropping them without a trace.
+                missed = entries[-1][0] - cursor - 1
+                cursor = entries[0][0]
+
+            if missed:
+                yield json.dumps({"type": "gap", "missed": missed}).encode() + b"\n"
 
-            yield json.dumps(message).encode() + b"\n"
+            for _, envelope in reversed(entries):
+                if envelope.recipient in ("*", username):
+                    message = {"type": "envelope", "content": dump_schema(envelope)}
+                    yield json.dumps(message).encode() + b"\n"
 
     return StreamingResponse(HTTP_200, listen(), headers={
         "content-type": "application/json",
@@ -1,6 +1,6 @@
 import json
 
-from app import app
+from app import LOG, app
 from molten import testing
 
 client = testing.TestClient(app)
@@ -36,3 +36,23 @@ def test_users_can_broadcast_messages():
     # And the recipient should get the new envelope
     envelope = json.loads(next(receiver_response.stream))
     assert envelope == {"type": "envelope", "content": {"username": "John", "message": "Hi Jim!"}}
+
+
+def test_receivers_are_told_when_they_miss_envelopes():
+    # Given that I am receiving envelopes
+    receiver_response = client.get(app.reverse_uri("receive_envelopes", username="Jim"))
+
+    # When more envelopes are broadcast than the log can hold
+    for i in range(LOG.maxlen + 2):
+        client.post(app.reverse_uri("send_envelope"), json={
+            "username": "John",
+            "message": f"Message {i}",
+        })
+
+    # Then the recipient should be told how many envelopes it missed
+    notice = json.loads(next(receiver_response.stream))
+    assert notice == {"type": "gap", "missed": 2}
+
+    # And it should get the envelopes that are still in the log
+    envelope = json.loads(next(receiver_response.stream))
+    assert envelope == {"type": "envelope", "content": {"username": "John", "message": "Message 2"}}
@@ -5,7 +5,7 @@ app = setup_app()
 
 
 def create_tables(database: Database) -> None:
-    with database.get_cursor() as cursor:
+    with database.get_cursor(write=True) as cursor:
         cursor.execute("create table if not exists categories(name text, unique(name))")
         cursor.execute("create table if not exists tags(name text, unique(name))")
         cursor.execute("create table if not exists pets(name text, category integer, status text, foreign key(category) references categories(rowid))")  # noqa
@@ -17,20 +17,20 @@ class CategoryManager:
         self.database = database
 
     def create(self, category: Category) -> Category:
-        with self.database.get_cursor() as cursor:
-            cursor.execute("insert or ignore into categories(name) values(?)", [category.name])
-            if cursor.lastrowid == 0:
-                cursor.execute("select rowid as id from categories where name = ? limit 1", [category.name])
-                category.id = cursor.fetchone()["id"]
-            else:
-                category.id = cursor.lastrowid
-
+        with self.database.get_cursor(write=True) as cursor:
+            cursor.execute(
+                "insert into categories(name) values(?) "
+                "on conflict(name) do update set name = excluded.name "
+                "returning rowid as id",
+                [category.name],
+            )
+            category.id = cursor.fetchone()["id"]
             return category
 
     def get_all(self) -> List[Category]:
         with self.database.get_cursor() as cursor:
             cursor.execute("select rowid as id, name from categories order by name")
-            return [Category(**data) for data in cursor.fetchall()]
+            return [Category(*data) for data in cursor]
 
     def get_by_id(self, category_id: int) -> Optional[Category]:
         with self.database.get_cursor() as cursor:
@@ -39,7 +39,7 @@ class CategoryManager:
             if not data:
                 return None
 
-            return Category(**data)
+            return Category(*data)
 
 
 class CategoryManagerComponent:
@@ -1,26 +1,87 @@
 import sqlite3
+import threading
 from contextlib import contextmanager
 from inspect import Parameter
 from typing import Iterable
 
+#: The number of parameters that can safely be bound in a single
+#: statement.  SQLite's default limit is 999 in versions prior to 3.32.
+MAX_VARIABLES = 900
+
+#: The number of prepared statements each connection keeps around.
+#: Batched queries produce a distinct statement for every batch size
+#: so this is larger than sqlite3's default.
+CACHED_STATEMENTS = 512
+
+#: The max number of idle cursors each thread holds on to.
+MAX_IDLE_CURSORS = 8
+
 
 class Database:
     def __init__(self, filename: str = "db.sqlite3") -> None:
-        self.connection = sqlite3.connect(filename)
-        self.connection.row_factory = sqlite3.Row
+        self.filename = filename
+        self.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Every thread gets its own connection so that concurrent
+        # requests never join each other's transactions and readers
+        # can run alongside the writer in WAL mode.
+        try:
+            return self.local.connection
+        except AttributeError:
+            connection = self.local.connection = sqlite3.connect(
+                self.filename,
+                isolation_level=None,
+                cached_statements=CACHED_STATEMENTS,
+            )
+            connection.row_factory = sqlite3.Row
+            connection.executescript("""
+                pragma journal_mode = wal;
+                pragma synchronous = normal;
+                pragma temp_store = memory;
+                pragma mmap_size = 268435456;
+                pragma cache_size = -65536;
+            """)
+            return connection
 
     @contextmanager
-    def get_cursor(self) -> Iterable[sqlite3.Cursor]:
-        cursor = self.connection.cursor()
+    def get_cursor(self, write: bool = False) -> Iterable[sqlite3.Cursor]:
+        """Get a cursor inside a transaction.  Pass write=True when the
+        cursor is going to modify the database so that the transaction
+        takes the write lock up front instead of failing to upgrade
+        from a read lock later on.
+        """
+        connection = self.connection
+
+        # Cursors are reused between requests rather than being
+        # allocated and closed every time.
+        try:
+            idle_cursors = self.local.idle_cursors
+        except AttributeError:
+            idle_cursors = self.local.idle_cursors = []
+
+        cursor = idle_cursors.pop() if idle_cursors else connection.cursor()
+
+        # Transactions are managed by hand since the connection is in
+        # autocommit mode.  Nested calls join the outermost transaction.
+        owns_transaction = not connection.in_transaction
+        if owns_transaction:
+            cursor.execute("begin immediate" if write else "begin")
 
         try:
             yield cursor
-            self.connection.commit()
+            if owns_transaction:
+                cursor.execute("commit")
         except Exception:
-            self.connection.rollback()
+            if owns_transaction:
+                cursor.execute("rollback")
             raise
         finally:
-            cursor.close()
+            if len(idle_cursors) < MAX_IDLE_CURSORS:
+                idle_cursors.append(cursor)
+            else:
+                cursor.close()
 
 
 class DatabaseComponent:
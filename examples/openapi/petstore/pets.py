@@ -1,10 +1,10 @@
 from inspect import Parameter
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from molten import HTTP_201, HTTP_204, HTTP_404, HTTPError, Route, annotate, field, schema
 
 from .categories import Category, CategoryManager
-from .database import Database
+from .database import MAX_VARIABLES, Database
 from .tags import Tag, TagManager
 
 
@@ -24,7 +24,9 @@ class PetManager:
         self.tag_manager = tag_manager
 
     def create(self, pet: Pet) -> Pet:
-        with self.database.get_cursor() as cursor:
+        with self.database.get_cursor(write=True) as cursor:
+            # The tag and category managers join this cursor's
+            # transaction so the whole pet is committed at once.
             pet.tags = self.tag_manager.create_all(pet.tags)
             pet.category = self.category_manager.create(pet.category)
 
@@ -35,13 +37,19 @@ class PetManager:
             ])
             pet.id = cursor.lastrowid
 
-            cursor.executemany("insert into pets_tags(tag, pet) values(?, ?)", [
-                [tag.id, pet.id] for tag in pet.tags
-            ])
+            # Each row binds two parameters.
+            batch_size = MAX_VARIABLES // 2
+            for i in range(0, len(pet.tags), batch_size):
+                chunk = pet.tags[i:i + batch_size]
+                placeholders = ", ".join(["(?, ?)"] * len(chunk))
+                cursor.execute(f"insert into pets_tags(tag, pet) values {placeholders}", [
+                    value for tag in chunk for value in (tag.id, pet.id)
+                ])
+
             return pet
 
     def delete(self, pet_id: int) -> None:
-        with self.database.get_cursor() as cursor:
+        with self.database.get_cursor(write=True) as cursor:
             cursor.execute("delete from pets where rowid = ?", [pet_id])
 
     def get_all(self) -> List[Pet]:
@@ -52,34 +60,39 @@ class PetManager:
             )
             rows = cursor.fetchall()
 
-            cursor.execute("select pt.pet as pet_id, pt.tag as tag_id, t.name as tag_name from tags as t join pets_tags as pt on pt.tag = t.rowid")  # noqa
-            tags_by_pet = {data["pet_id"]: Tag(data["tag_id"], data["tag_name"]) for data in cursor.fetchall()}
+            pet_ids = [data[0] for data in rows]
+            tags_by_pet: Dict[int, List[Tag]] = {}
+            for i in range(0, len(pet_ids), MAX_VARIABLES):
+                chunk = pet_ids[i:i + MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"select pt.pet as pet_id, t.rowid as tag_id, t.name as tag_name from tags as t join pets_tags as pt on pt.tag = t.rowid where pt.pet in ({placeholders})", chunk)  # noqa
+                for data in cursor.fetchall():
+                    tags_by_pet.setdefault(data["pet_id"], []).append(Tag(data["tag_id"], data["tag_name"]))
+
             return [
-                Pet(
-                    id=data["id"],
-                    name=data["name"],
-                    tags=tags_by_pet.get(data["id"], []),
-                    category=Category(data["category_id"], data["category_name"]),
-                    status=data["status"],
-                ) for data in rows
+                Pet(pet_id, name, tags_by_pet.get(pet_id, []), Category(category_id, category_name), status)
+                for pet_id, name, status, category_id, category_name in rows
             ]
 
     def get_by_id(self, pet_id: int) -> Optional[Pet]:
         with self.database.get_cursor() as cursor:
             cursor.execute(
-                "select p.rowid as id, p.name as name, p.status as status, c.rowid as category_id, c.name as category_name from pets as p "  # noqa
-                "join categories as c on c.rowid = p.category where p.rowid = ? limit 1",
+                "select p.rowid as id, p.name as name, p.status as status, c.rowid as category_id, c.name as category_name, t.rowid as tag_id, t.name as tag_name from pets as p "  # noqa
+                "join categories as c on c.rowid = p.category "
+                "left join pets_tags as pt on pt.pet = p.rowid "
+                "left join tags as t on t.rowid = pt.tag "
+                "where p.rowid = ?",
                 [pet_id]
             )
-            data = cursor.fetchone()
-            if not data:
+            rows = cursor.fetchall()
+            if not rows:
                 return None
 
-            cursor.execute("select t.rowid as id, t.name as name from tags as t join pets_tags as pt on pt.tag = t.rowid where pt.pet = ?", [pet_id])  # noqa
+            data = rows[0]
             return Pet(
                 id=data["id"],
                 name=data["name"],
-                tags=[Tag(**data) for data in cursor.fetchall()],
+                tags=[Tag(row["tag_id"], row["tag_name"]) for row in rows if row["tag_id"] is not None],
                 category=Category(data["category_id"], data["category_name"]),
                 status=data["status"],
             )
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 
 from molten import HTTP_201, Route, annotate, field, schema
 
-from .database import Database
+from .database import MAX_VARIABLES, Database
 
 
 @schema
@@ -17,23 +17,38 @@ class TagManager:
         self.database = database
 
     def create(self, tag: Tag) -> Tag:
-        with self.database.get_cursor() as cursor:
-            cursor.execute("insert or ignore into tags(name) values(?)", [tag.name])
-            if cursor.lastrowid == 0:
-                cursor.execute("select rowid as id from tags where name = ? limit 1", [tag.name])
-                tag.id = cursor.fetchone()["id"]
-            else:
-                tag.id = cursor.lastrowid
-
+        with self.database.get_cursor(write=True) as cursor:
+            cursor.execute(
+                "insert into tags(name) values(?) "
+                "on conflict(name) do update set name = excluded.name "
+                "returning rowid as id",
+                [tag.name],
+            )
+            tag.id = cursor.fetchone()["id"]
             return tag
 
     def create_all(self, tags: List[Tag]) -> List[Tag]:
-        return [self.create(tag) for tag in tags]
+        with self.database.get_cursor(write=True) as cursor:
+            names = [tag.name for tag in tags]
+            ids_by_name = {}
+            for i in range(0, len(names), MAX_VARIABLES):
+                chunk = names[i:i + MAX_VARIABLES]
+                placeholders = ", ".join(["(?)"] * len(chunk))
+                cursor.execute(f"insert or ignore into tags(name) values {placeholders}", chunk)
+
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"select rowid as id, name from tags where name in ({placeholders})", chunk)
+                ids_by_name.update((data["name"], data["id"]) for data in cursor.fetchall())
+
+            for tag in tags:
+                tag.id = ids_by_name[tag.name]
+
+            return tags
 
     def get_all(self) -> List[Tag]:
         with self.database.get_cursor() as cursor:
             cursor.execute("select rowid as id, name from tags order by name")
-            return [Tag(**data) for data in cursor.fetchall()]
+            return [Tag(*data) for data in cursor]
 
 
 class TagManagerComponent:
@@ -13,18 +13,25 @@ Usage:
     Returns the data for a paste.
 """
 import os
+import secrets
 import shutil
-import uuid
 
 from molten import HTTP_200, HTTP_404, App, Request, Response, Route
 
 
 def generate_paste_id():
-    return str(uuid.uuid4())
+    return secrets.token_urlsafe(16)
+
+
+#: The request body is a socket stream so it has to be copied in
+#: userspace.  Larger chunks mean fewer read and write calls.
+COPY_CHUNK_SIZE = 1024 * 1024
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 
 def relative_path(*segments):
-    return os.path.join(os.path.abspath(os.path.dirname(__file__)), *segments)
+    return os.path.join(BASE_DIR, *segments)
 
 
 def index() -> Response:
@@ -36,13 +43,16 @@ def index() -> Response:
 def upload(request: Request) -> str:
     paste_id = generate_paste_id()
     with open(relative_path("uploads", paste_id), "wb") as paste:
-        shutil.copyfileobj(request.body_file, paste)
+        shutil.copyfileobj(request.body_file, paste, COPY_CHUNK_SIZE)
 
     return f"{request.scheme}://{request.host}:{request.port}/{paste_id}"
 
 
 def get_paste(paste_id: str) -> Response:
     try:
+        # Streaming the file object itself lets molten compute the
+        # content length via fstat and hand the file to the server's
+        # wsgi.file_wrapper, which may send it using sendfile(2).
         paste = open(relative_path("uploads", paste_id), "rb")
         return Response(HTTP_200, stream=paste)
     except FileNotFoundError:
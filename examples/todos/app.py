@@ -1,11 +1,14 @@
+import json
 import sqlite3
+import threading
 from contextlib import contextmanager
 from inspect import Parameter
+from io import BytesIO
 from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 from molten import (
-    HTTP_201, HTTP_204, HTTP_403, HTTP_404, App, Component, Field, Header, HTTPError, Include,
-    Middleware, Request, ResponseRendererMiddleware, Route, schema
+    HTTP_200, HTTP_201, HTTP_204, HTTP_403, HTTP_404, App, Component, Field, Header, HTTPError,
+    Include, Middleware, Request, Response, ResponseRendererMiddleware, Route, schema
 )
 from molten.openapi import HTTPSecurityScheme, Metadata, OpenAPIHandler, OpenAPIUIHandler
 
@@ -18,26 +21,56 @@ def AuthorizationMiddleware(handler: Callable[..., Any]) -> Callable[..., Any]:
     return middleware
 
 
+#: The max number of todos TodoManager.create_many inserts per statement.
+MAX_TODOS_PER_INSERT = 450
+
+#: The max number of idle cursors the DB holds on to.
+MAX_IDLE_CURSORS = 8
+
+
 class DB:
     def __init__(self) -> None:
-        self._db = sqlite3.connect(":memory:")
-        self._db.row_factory = sqlite3.Row
+        # The in-memory database only lives as long as this connection
+        # so it is shared between threads and guarded by a lock.
+        self._db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+        self._db.executescript("""
+            pragma journal_mode = memory;
+            pragma synchronous = off;
+            pragma temp_store = memory;
+            pragma cache_size = -64000;
+        """)
+        self._lock = threading.RLock()
+        self._idle_cursors: List[sqlite3.Cursor] = []
 
         with self.get_cursor() as cursor:
             cursor.execute("create table todos(description text, status text)")
 
     @contextmanager
     def get_cursor(self) -> Iterator[sqlite3.Cursor]:
-        cursor = self._db.cursor()
-
-        try:
-            yield cursor
-            self._db.commit()
-        except Exception:
-            self._db.rollback()
-            raise
-        finally:
-            cursor.close()
+        with self._lock:
+            # Cursors are reused between requests rather than being
+            # allocated and closed every time.
+            cursor = self._idle_cursors.pop() if self._idle_cursors else self._db.cursor()
+
+            # Transactions are managed by hand since the connection is
+            # in autocommit mode.  Nested calls join the outermost one.
+            owns_transaction = not self._db.in_transaction
+            if owns_transaction:
+                cursor.execute("begin")
+
+            try:
+                yield cursor
+                if owns_transaction:
+                    cursor.execute("commit")
+            except Exception:
+                if owns_transaction:
+                    cursor.execute("rollback")
+                raise
+            finally:
+                if len(self._idle_cursors) < MAX_IDLE_CURSORS:
+                    self._idle_cursors.append(cursor)
+                else:
+                    cursor.close()
 
 
 class DBComponent:
@@ -58,6 +91,11 @@ class Todo:
     status: str = Field(choices=["todo", "done"], default="todo")
 
 
+@schema
+class TodoBatch:
+    todos: List[Todo]
+
+
 class TodoManager:
     def __init__(self, db: DB) -> None:
         self.db = db
@@ -72,10 +110,29 @@ class TodoManager:
             todo.id = cursor.lastrowid
             return todo
 
+    def create_many(self, todos: List[Todo]) -> List[Todo]:
+        with self.db.get_cursor() as cursor:
+            # Each batch is inserted using a single statement, keeping
+            # well below SQLite's limit of 999 bound parameters.
+            for i in range(0, len(todos), MAX_TODOS_PER_INSERT):
+                batch = todos[i:i + MAX_TODOS_PER_INSERT]
+                values = ", ".join(["(?, ?)"] * len(batch))
+                cursor.execute(f"insert into todos(description, status) values {values}", [
+                    value for todo in batch for value in (todo.description, todo.status)
+                ])
+
+                # Rows inserted by a single statement get consecutive
+                # ids so they can be derived from the last one.
+                first_id = cursor.lastrowid - len(batch) + 1
+                for todo_id, todo in enumerate(batch, first_id):
+                    todo.id = todo_id
+
+            return todos
+
     def get_all(self) -> List[Todo]:
         with self.db.get_cursor() as cursor:
             cursor.execute("select rowid as id, description, status from todos")
-            return [Todo(**data) for data in cursor.fetchall()]
+            return [Todo(todo_id, description, status) for todo_id, description, status in cursor]
 
     def get_by_id(self, todo_id: int) -> Optional[Todo]:
         with self.db.get_cursor() as cursor:
@@ -84,7 +141,7 @@ class TodoManager:
             if data is None:
                 return None
 
-            return Todo(**data)
+            return Todo(*data)
 
     def delete_by_id(self, todo_id: int) -> None:
         with self.db.get_cursor() as cursor:
@@ -117,6 +174,10 @@ def create_todo(todo: Todo, manager: TodoManager) -> Tuple[str, Todo]:
     return HTTP_201, manager.create(todo)
 
 
+def create_todos(batch: TodoBatch, manager: TodoManager) -> Tuple[str, List[Todo]]:
+    return HTTP_201, manager.create_many(batch.todos)
+
+
 def delete_todo(todo_id: str, manager: TodoManager) -> Tuple[str, None]:
     manager.delete_by_id(int(todo_id))
     return HTTP_204, None
@@ -133,9 +194,9 @@ middleware: List[Middleware] = [
     AuthorizationMiddleware,
 ]
 
-get_docs = OpenAPIUIHandler()
+get_docs = OpenAPIUIHandler(schema_route_name="get_schema")
 
-get_schema = OpenAPIHandler(
+openapi_handler = OpenAPIHandler(
     metadata=Metadata(
         title="Todo API",
         description="An API for managing todos.",
@@ -148,10 +209,18 @@ get_schema = OpenAPIHandler(
 )
 
 
+def get_schema() -> Response:
+    return Response(HTTP_200, stream=BytesIO(SCHEMA), headers={
+        "content-type": "application/json",
+        "content-length": str(len(SCHEMA)),
+    })
+
+
 routes: List[Union[Route, Include]] = [
     Include("/v1/todos", [
         Route("/", list_todos),
         Route("/", create_todo, method="POST"),
+        Route("/batch", create_todos, method="POST"),
         Route("/{todo_id}", get_todo),
         Route("/{todo_id}", delete_todo, method="DELETE"),
     ]),
@@ -165,3 +234,7 @@ app = App(
     middleware=middleware,
     routes=routes,
 )
+
+#: The OpenAPI document can't change once the app has been built so
+#: it's generated and encoded up front rather than on every request.
+SCHEMA = json.dumps(app.injector.get_resolver().resolve(openapi_handler)()).encode("utf-8")
@@ -59,3 +59,26 @@ def test_todos(client, auth):
         auth=auth,
     )
     assert response.status_code == 404
+
+
+def test_todos_can_be_created_in_batches(client, auth):
+    todos = [{"description": f"todo {i}"} for i in range(1000)]
+    response = client.post(app.reverse_uri("create_todos"), auth=auth, json={
+        "todos": todos,
+    })
+    assert response.status_code == 201
+
+    created_todos = response.json()
+    assert len(created_todos) == 1000
+
+    response = client.get(app.reverse_uri("list_todos"), auth=auth)
+    assert response.json() == created_todos
+
+
+def test_schema_is_served_from_pre_encoded_bytes(client):
+    response = client.get(app.reverse_uri("get_schema"))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(response.data))
+    assert response.json()["info"]["title"] == "Todo API"
+    assert "/v1/todos/batch" in response.json()["paths"]
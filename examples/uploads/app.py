@@ -4,8 +4,11 @@ from molten import App, RequestData, Route, UploadedFile, schema
 from molten.openapi import Metadata, OpenAPIHandler, OpenAPIUIHandler
 
 
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
 def path_to(*segments):
-    return os.path.join(os.path.abspath(os.path.dirname(__file__)), *segments)
+    return os.path.join(BASE_DIR, *segments)
 
 
 def upload(data: RequestData) -> None:
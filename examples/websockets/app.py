@@ -22,9 +22,13 @@ def chat(sock: Websocket):
         if isinstance(message, CloseMessage):
             break
 
-        for listener in LISTENERS:
+        # Encode the message once up front rather than once per
+        # listener.  LISTENERS is copied because other greenlets may
+        # modify it while this one is blocked sending data.
+        data = message.encode()
+        for listener in list(LISTENERS):
             if listener is not sock:
-                listener.send(message)
+                listener.send_encoded(data)
 
     LISTENERS.remove(sock)
 
@@ -16,19 +16,19 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
-import sys
+from io import BytesIO
 from typing import Any, Callable, Iterable, List, Optional
 from wsgiref.util import FileWrapper  # type: ignore
 
 from .components import (
-    CookiesComponent, HeaderComponent, QueryParamComponent, RequestBodyComponent,
-    RequestDataComponent, RouteComponent, RouteParamsComponent, SchemaComponent,
-    UploadedFileComponent
+    CookiesComponent, HeaderComponent, QueryParamComponent, QueryParamsComponent,
+    RequestBodyComponent, RequestDataComponent, RouteComponent, RouteParamsComponent,
+    SchemaComponent, UploadedFileComponent
 )
 from .dependency_injection import Component, DependencyInjector
 from .errors import ParseError, RequestHandled, RequestParserNotAvailable
 from .http import (
-    HTTP_204, HTTP_400, HTTP_404, HTTP_415, HTTP_500, Headers, QueryParams, Request, Response
+    HTTP_204, HTTP_400, HTTP_404, HTTP_415, HTTP_500, Headers, Request, Response
 )
 from .parsers import JSONParser, MultiPartParser, RequestParser, URLEncodingParser
 from .renderers import JSONRenderer, ResponseRenderer
@@ -92,6 +92,7 @@ class BaseApp:
             HeaderComponent(),
             CookiesComponent(),
             QueryParamComponent(),
+            QueryParamsComponent(),
             RequestBodyComponent(),
             RequestDataComponent(self.parsers),
             SchemaComponent(),
@@ -158,17 +159,18 @@ class App(BaseApp):
 
     def __call__(self, environ: Environ, start_response: StartResponse) -> Iterable[bytes]:
         request = Request.from_environ(environ)
+        # Host, Method, etc. are NewTypes so their values are the
+        # underlying objects.  Wrapping them would only add calls.
         resolver = self.injector.get_resolver({
             Environ: environ,
             Headers: request.headers,
-            Host: Host(request.host),
-            Method: Method(request.method),
-            Port: Port(request.port),
-            QueryParams: request.params,
-            QueryString: QueryString(environ.get("QUERY_STRING", "")),
+            Host: request.host,
+            Method: request.method,
+            Port: request.port,
+            QueryString: environ.get("QUERY_STRING", ""),
             Request: request,
-            RequestInput: RequestInput(request.body_file),
-            Scheme: Scheme(request.scheme),
+            RequestInput: request.body_file,
+            Scheme: request.scheme,
             StartResponse: start_response,  # type: ignore
         })
 
@@ -188,7 +190,6 @@ class App(BaseApp):
             for middleware in reversed(self.middleware):
                 handler = resolver.resolve(middleware(handler))
 
-            exc_info = None
             response = handler()
         except RequestHandled:
             # This is used to break out of gunicorn's keep-alive loop.
@@ -196,21 +197,29 @@ class App(BaseApp):
             # from a closed socket.
             raise NoMoreData()
         except RequestParserNotAvailable:
-            exc_info = None
             response = resolver.resolve(self.handle_415)()
         except ParseError as e:
-            exc_info = None
             response = resolver.resolve(self.handle_parse_error)(exception=e)
         except Exception as e:
-            exc_info = sys.exc_info()
             response = resolver.resolve(self.handle_exception)(exception=e)
 
-        content_length = response.get_content_length()
-        if content_length is not None:
-            response.headers.add("content-length", str(content_length))
+        headers = list(response.headers)
+        if "content-length" not in response.headers:
+            content_length = response.get_content_length()
+            if content_length is not None:
+                headers.append(("content-length", str(content_length)))
 
-        start_response(response.status, list(response.headers), exc_info)
+        # Headers are never sent before this point so there is no
+        # response for the server to replace and exc_info isn't needed.
+        start_response(response.status, headers, None)
         if response.status != HTTP_204:
+            # In-memory content, such as rendered JSON, is sent as a
+            # single chunk instead of being read through a wrapper.
+            if type(response.stream) is BytesIO:
+                return [response.stream.read()]
+
+            # The file wrapper belongs to whichever server is calling
+            # the app so it has to be looked up on every request.
             wrapper = environ.get("wsgi.file_wrapper", FileWrapper)
             return wrapper(response.stream)
         else:
@@ -15,7 +15,6 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 KT = TypeVar("KT")
@@ -35,17 +34,9 @@ class MultiDict(Iterable[Tuple[KT, VT]]):
     __slots__ = ["_data"]
 
     def __init__(self, mapping: Optional[Mapping[KT, VT]] = None) -> None:
-        self._data: Dict[KT, List[VT]] = defaultdict(list)
+        self._data: Dict[KT, List[VT]] = {}
         self._add_all(mapping or {})
 
-    def _add(self, name: KT, value: Union[VT, List[VT]]) -> None:
-        """Add values for a particular key.
-        """
-        if isinstance(value, list):
-            self._data[name].extend(value)
-        else:
-            self._data[name].append(value)
-
     def _add_all(self, mapping: Mapping[KT, VT]) -> None:
         """Add a group of values.
         """
@@ -56,8 +47,14 @@ class MultiDict(Iterable[Tuple[KT, VT]]):
         else:
             items = mapping
 
+        # Values are inserted inline rather than via a helper method
+        # to avoid paying for a method call per item.
+        data = self._data
         for name, value_or_values in items:
-            self._add(name, value_or_values)
+            if isinstance(value_or_values, list):
+                data.setdefault(name, []).extend(value_or_values)
+            else:
+                data.setdefault(name, []).append(value_or_values)
 
     def get(self, name: KT, default: Optional[VT] = None) -> Optional[VT]:
         """Get the last value for a given key.
@@ -70,7 +67,7 @@ class MultiDict(Iterable[Tuple[KT, VT]]):
     def get_all(self, name: KT) -> List[VT]:
         """Get all the values for a given key.
         """
-        return self._data[name]
+        return self._data.get(name, [])
 
     def __getitem__(self, name: KT) -> VT:
         """Get the last value for a given key.
@@ -80,7 +77,7 @@ class MultiDict(Iterable[Tuple[KT, VT]]):
         """
         try:
             return self._data[name][-1]
-        except IndexError:
+        except (IndexError, KeyError):
             raise KeyError(name)
 
     def __iter__(self) -> Iterator[Tuple[KT, VT]]:
@@ -22,7 +22,7 @@ from .dependency_injection import DependencyResolver
 from .errors import (
     HeaderMissing, HTTPError, ParamMissing, RequestParserNotAvailable, ValidationError
 )
-from .http import HTTP_400, Cookies, Headers, QueryParams, UploadedFile
+from .http import HTTP_400, Cookies, Headers, QueryParams, Request, UploadedFile
 from .parsers import RequestParser
 from .router import Route
 from .typing import (
@@ -45,6 +45,8 @@ class HeaderComponent:
         ...
     """
 
+    __slots__ = ()
+
     is_cacheable = False
     is_singleton = False
 
@@ -65,6 +67,28 @@ class HeaderComponent:
             raise HTTPError(HTTP_400, {"errors": {header_name: "missing"}})
 
 
+class QueryParamsComponent:
+    """Retrieves the request's query params.  Query strings are only
+    parsed for requests whose handlers or middleware depend on them.
+
+    Examples:
+
+      def handle(params: QueryParams) -> Response:
+        ...
+    """
+
+    __slots__ = ()
+
+    is_cacheable = True
+    is_singleton = False
+
+    def can_handle_parameter(self, parameter: Parameter) -> bool:
+        return parameter.annotation is QueryParams
+
+    def resolve(self, request: Request) -> QueryParams:
+        return request.params
+
+
 class QueryParamComponent:
     """Retrieves a named query param from the request.
 
@@ -77,6 +101,8 @@ class QueryParamComponent:
         ...
     """
 
+    __slots__ = ()
+
     is_cacheable = False
     is_singleton = False
 
@@ -84,11 +110,11 @@ class QueryParamComponent:
         _, annotation = extract_optional_annotation(parameter.annotation)
         return annotation is QueryParam
 
-    def resolve(self, parameter: Parameter, params: QueryParams) -> Optional[str]:
+    def resolve(self, parameter: Parameter, request: Request) -> Optional[str]:
         is_optional, _ = extract_optional_annotation(parameter.annotation)
 
         try:
-            return params[parameter.name]
+            return request.params[parameter.name]
         except ParamMissing:
             if is_optional:
                 return None
@@ -105,6 +131,8 @@ class RequestBodyComponent:
         ...
     """
 
+    __slots__ = ()
+
     is_cacheable = True
     is_singleton = False
 
@@ -154,6 +182,8 @@ class CookiesComponent:
         cookies["some-cookie"]
     """
 
+    __slots__ = ()
+
     is_cacheable = True
     is_singleton = False
 
@@ -221,6 +251,8 @@ class SchemaComponent:
     """A component that validates request data according to a schema.
     """
 
+    __slots__ = ()
+
     is_cacheable = False
     is_singleton = False
 
@@ -243,6 +275,8 @@ class UploadedFileComponent:
         ...
     """
 
+    __slots__ = ()
+
     is_cacheable = False
     is_singleton = False
 
@@ -18,7 +18,7 @@
 import functools
 import inspect
 from inspect import Parameter
-from typing import Any, Callable, Dict, Optional, Sequence, no_type_check
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, no_type_check
 
 from molten import BaseApp
 
@@ -79,13 +79,13 @@ def actor(fn=None, **kwargs):
 @no_type_check
 def _inject(fn: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
     def decorator(fn):
-        parameters = {name: i for i, name in enumerate(inspect.signature(fn).parameters)}
+        parameter_names = tuple(inspect.signature(fn).parameters)
 
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
             try:
                 resolver = _INJECTOR.get_resolver()
-                resolver.add_component(_ArgumentResolver(parameters, args, kwargs))
+                resolver.add_component(_ArgumentResolver(parameter_names, args, kwargs))
             except AttributeError:  # pragma: no cover
                 raise RuntimeError(
                     "Dramatiq support is not set up correctly. "
@@ -106,14 +106,11 @@ class _ArgumentResolver:
     is_cacheable = False
     is_singleton = False
 
-    def __init__(self, parameters: Dict[str, int], args: Sequence[Any], kwargs: Dict[str, Any]) -> None:
+    def __init__(self, parameter_names: Tuple[str, ...], args: Sequence[Any], kwargs: Dict[str, Any]) -> None:
         self.state = state = kwargs
-        for name, idx in parameters.items():
+        for name, arg in zip(parameter_names, args):
             if name not in state:
-                try:
-                    state[name] = args[idx]
-                except IndexError:
-                    continue
+                state[name] = arg
 
     def can_handle_parameter(self, parameter: Parameter) -> bool:
         return parameter.name in self.state or \
@@ -18,10 +18,10 @@
 from io import BytesIO
 from typing import Any
 
-from molten import ParseError, RequestInput, Response, dump_schema, is_schema
+from molten import ParseError, RequestBody, Response, dump_schema, is_schema
 
 try:
-    from msgpack import Unpacker, packb  # type: ignore
+    from msgpack import packb, unpackb  # type: ignore
 except ImportError:  # pragma: no cover
     raise ImportError("'msgpack' package missing. Run 'pip install msgpack'.")
 
@@ -37,9 +37,9 @@ class MsgpackParser:
     def can_parse_content(self, content_type: str) -> bool:
         return content_type.startswith("application/x-msgpack")
 
-    def parse(self, body_file: RequestInput) -> Any:
+    def parse(self, data: RequestBody) -> Any:
         try:
-            return next(Unpacker(body_file, raw=False))
+            return unpackb(data, raw=False)
         except Exception as e:
             raise ParseError(f"msgpack input could not be parsed: {e}")
 
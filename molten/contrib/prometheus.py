@@ -17,7 +17,7 @@
 
 import time
 from io import BytesIO
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Tuple
 
 from molten import HTTP_200, Request, Response
 
@@ -45,6 +45,14 @@ REQUESTS_INPROGRESS = Gauge(
     ["method", "path"],
 )
 
+#: Children of the request metrics, keyed by their label values.
+#: Looking these up via labels() on every request is comparatively
+#: expensive and, since the middleware never removes children from
+#: the metrics, they can be reused for the lifetime of the process.
+_REQUEST_DURATION_CHILDREN: Dict[Tuple[str, ...], Any] = {}
+_REQUEST_COUNT_CHILDREN: Dict[Tuple[str, ...], Any] = {}
+_REQUESTS_INPROGRESS_CHILDREN: Dict[Tuple[str, ...], Any] = {}
+
 #: Micro-optimization to avoid allocating a new dict on every metrics
 #: request.  Response itself copies the headers its given so this
 #: shouldn't be a problem.
@@ -74,7 +82,8 @@ def prometheus_middleware(handler: Callable[..., Any]) -> Callable[..., Any]:
     def middleware(request: Request) -> Any:
         status = "500 Internal Server Error"
         start_time = time.monotonic()
-        requests_inprogress = REQUESTS_INPROGRESS.labels(request.method, request.path)
+        method, path = request.method, request.path
+        requests_inprogress = _get_child(REQUESTS_INPROGRESS, _REQUESTS_INPROGRESS_CHILDREN, method, path)
         requests_inprogress.inc()
 
         try:
@@ -83,6 +92,15 @@ def prometheus_middleware(handler: Callable[..., Any]) -> Callable[..., Any]:
             return response
         finally:
             requests_inprogress.dec()
-            REQUEST_COUNT.labels(request.method, request.path, status).inc()
-            REQUEST_DURATION.labels(request.method, request.path).observe(time.monotonic() - start_time)
+            _get_child(REQUEST_COUNT, _REQUEST_COUNT_CHILDREN, method, path, status).inc()
+            request_duration = _get_child(REQUEST_DURATION, _REQUEST_DURATION_CHILDREN, method, path)
+            request_duration.observe(time.monotonic() - start_time)
     return middleware
+
+
+def _get_child(metric: Any, children: Dict[Tuple[str, ...], Any], *labels: str) -> Any:
+    try:
+        return children[labels]
+    except KeyError:
+        child = children[labels] = metric.labels(*labels)
+        return child
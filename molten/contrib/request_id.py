@@ -16,9 +16,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import os
 from threading import local
 from typing import Any, Callable, Optional
-from uuid import uuid4
 
 from molten import Header
 
@@ -36,11 +36,22 @@ def set_request_id(request_id: Optional[str]) -> None:
     None, then a random id will be generated.
     """
     if request_id is None:
-        request_id = str(uuid4())
+        request_id = _generate_request_id()
 
     STATE.request_id = request_id
 
 
+def _generate_request_id() -> str:
+    # This generates the same kind of string as str(uuid4()) (a random,
+    # RFC 4122 version 4 UUID) but it's about 3x faster since it
+    # doesn't have to go through constructing a UUID instance.
+    data = bytearray(os.urandom(16))
+    data[6] = data[6] & 0x0F | 0x40
+    data[8] = data[8] & 0x3F | 0x80
+    hexdata = data.hex()
+    return f"{hexdata[:8]}-{hexdata[8:12]}-{hexdata[12:16]}-{hexdata[16:20]}-{hexdata[20:]}"
+
+
 class RequestIdFilter(logging.Filter):
     """Adds the current request id to log records, making it possible
     to log request ids via the standard logging module.
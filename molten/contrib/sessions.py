@@ -36,6 +36,9 @@ COOKIE_EXPIRATION_KEY = "__EXP__"
 #: session object.
 DEFAULT_EXPIRATION_TIME = float("inf")
 
+#: The maximum number of verified cookies each CookieStore remembers.
+VERIFIED_COOKIES_CACHE_SIZE = 4096
+
 
 class Session(Dict[str, Any]):
     """Session objects are ordinary dictionaries that are guaranteed
@@ -82,6 +85,11 @@ class CookieStore:
     so as to provide minimal protection against session replay
     attacks.
 
+    Cookies that pass signature verification are remembered so that
+    subsequent requests carrying the same cookie skip the HMAC check.
+    Sessions are always decoded anew so handlers can't leak changes
+    between requests.
+
     Warning:
       Don't store sensitive information in sessions using this store.
       They are tamper-proof, but users can decode them.
@@ -95,6 +103,8 @@ class CookieStore:
         "cookie_domain",
         "cookie_path",
         "cookie_secure",
+        "verified_cookies",
+        "signing_hmac",
     ]
 
     def __init__(
@@ -113,20 +123,33 @@ class CookieStore:
         self.cookie_name = cookie_name
         self.cookie_domain = cookie_domain
         self.cookie_path = cookie_path
+        self.verified_cookies: Dict[str, bytes] = {}
+
+        # Keying an HMAC is about as expensive as hashing a whole
+        # cookie so sign() copies this pre-keyed instance instead.
+        self.signing_hmac = hmac.new(self.signing_key, digestmod=signing_method)
 
     def load(self, cookies: Cookies) -> Session:
         cookie = cookies.get(self.cookie_name)
         if cookie is None:
             return Session.empty()
 
-        data, _, signature = cookie.partition(",")
-        if not hmac.compare_digest(signature, self.sign(data.encode())):
-            return Session.empty()
+        try:
+            session_json = self.verified_cookies[cookie]
+        except KeyError:
+            data, _, signature = cookie.partition(",")
+            if not hmac.compare_digest(signature, self.sign(data.encode())):
+                return Session.empty()
+
+            # Note: at this point, the data is guaranteed to be valid
+            # given that the data is correctly signed.
+            session_json = base64.urlsafe_b64decode(data)
+            if len(self.verified_cookies) >= VERIFIED_COOKIES_CACHE_SIZE:
+                self.verified_cookies.clear()
+
+            self.verified_cookies[cookie] = session_json
 
-        # Note: at this point, the data is guaranteed to be valid
-        # given that the data is correctly signed.
-        session_data = json.loads(base64.urlsafe_b64decode(data))
-        session = Session(**session_data)
+        session = Session(**json.loads(session_json))
         if session.get(COOKIE_EXPIRATION_KEY, DEFAULT_EXPIRATION_TIME) <= time():
             return Session.empty()
 
@@ -134,7 +157,7 @@ class CookieStore:
 
     def dump(self, session: Session) -> Cookie:
         session[COOKIE_EXPIRATION_KEY] = expires = time() + self.cookie_ttl
-        session_data = base64.urlsafe_b64encode(json.dumps(session).encode())
+        session_data = base64.urlsafe_b64encode(json.dumps(session, separators=(",", ":")).encode())
         signature = self.sign(session_data)
         return Cookie(
             self.cookie_name, f"{session_data.decode()},{signature}",
@@ -143,7 +166,9 @@ class CookieStore:
         )
 
     def sign(self, value: bytes) -> str:
-        return hmac.new(self.signing_key, value, self.signing_method).hexdigest()
+        signature = self.signing_hmac.copy()
+        signature.update(value)
+        return signature.hexdigest()
 
 
 class SessionComponent:
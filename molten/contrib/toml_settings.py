@@ -23,9 +23,12 @@ from typing import Any, Dict, List, Optional, Union, cast
 from molten import Settings as Settings
 
 try:
-    import toml
+    import tomllib  # type: ignore
 except ImportError:  # pragma: no cover
-    raise ImportError("'toml' package missing. Run 'pip install toml'.")
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        raise ImportError("'tomli' package missing. Run 'pip install tomli'.")
 
 
 #: Canary value representing missing values.
@@ -80,7 +83,9 @@ class TOMLSettings(Settings):
           path: The path to the TOML file containing your settings.
           environment: The config environment to use.
         """
-        all_settings = toml.load(open(path))
+        with open(path, "rb") as settings_file:
+            all_settings = tomllib.load(settings_file)
+
         common_settings = all_settings.get("common", {})
         environment_settings = all_settings.get(environment, {})
         settings = cls({**common_settings, **environment_settings})
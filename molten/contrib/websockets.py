@@ -51,6 +51,11 @@ PSK = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
 #: The amount of bytes to request per recv call.
 CHUNKSIZE = 16 * 1024
 
+#: Frames whose payloads are smaller than this are written with a
+#: single call.  Larger payloads are written separately from their
+#: headers to avoid copying them.
+MAX_COALESCED_PAYLOAD_SIZE = 16 * 1024
+
 #: The maximum number of bytes text and binary frames can contain.
 MAX_MESSAGE_SIZE = 16 * 1024 * 1024
 
@@ -237,8 +242,8 @@ class _DataFrameHeader:
 
         return header
 
-    def to_stream(self, stream: _BufferedStream) -> None:
-        """Write this header to the output stream.
+    def to_bytes(self) -> bytearray:
+        """Encode this header.
         """
         output = bytearray()
 
@@ -278,7 +283,7 @@ class _DataFrameHeader:
         if self.mask:
             output.extend(self.mask)
 
-        stream.write(output)
+        return output
 
 
 class _DataFrame:
@@ -316,12 +321,27 @@ class _DataFrame:
     def to_stream(self, stream: _BufferedStream) -> None:
         """Write this data frame to the output stream.
         """
-        self.header.to_stream(stream)
+        if len(self.data) < MAX_COALESCED_PAYLOAD_SIZE:
+            stream.write(self.to_bytes())
+            return
+
+        stream.write(self.header.to_bytes())
         if self.header.mask:
             stream.write(self.header.mask_data(self.data))
         else:
             stream.write(self.data)
 
+    def to_bytes(self) -> bytearray:
+        """Encode this data frame, including its header.
+        """
+        output = self.header.to_bytes()
+        if self.header.mask:
+            output.extend(self.header.mask_data(self.data))
+        else:
+            output.extend(self.data)
+
+        return output
+
 
 class Message:
     """A websocket message, composed of one or more data frames.
@@ -344,10 +364,22 @@ class Message:
     def to_stream(self, stream: _BufferedStream) -> None:
         """Write this message to the output stream.
         """
+        self.to_frame().to_stream(stream)
+
+    def encode(self) -> bytearray:
+        """Encode this message as a single data frame.  The result may
+        be sent to any number of websockets via
+        :meth:`Websocket.send_encoded`, which is useful when
+        broadcasting the same message to many clients.
+        """
+        return self.to_frame().to_bytes()
+
+    def to_frame(self) -> _DataFrame:
+        """Wrap this message in a single, final data frame.
+        """
         output = self.get_output()
         header = _DataFrameHeader(fin=True, opcode=OPCODES_BY_MESSAGE[type(self)], length=len(output))
-        frame = _DataFrame(header, output)  # type: ignore
-        frame.to_stream(stream)
+        return _DataFrame(header, output)  # type: ignore
 
     def get_data(self) -> bytes:
         """Get this message's data as a bytestring.
@@ -542,6 +574,15 @@ class Websocket:
 
         message.to_stream(self.stream)
 
+    def send_encoded(self, data: Union[bytes, bytearray]) -> None:
+        """Send a message that was previously encoded using
+        :meth:`Message.encode` to the client.
+        """
+        if self.closed:
+            raise WebsocketClosedError("Websocket already closed.")
+
+        self.stream.write(data)
+
     def close(self, message: Optional[Message] = None) -> None:
         """Close this websocket and send a close message to the client.
 
@@ -17,7 +17,9 @@
 
 import functools
 from inspect import Parameter, signature
-from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, no_type_check
+from itertools import islice
+from types import FunctionType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar, no_type_check
 
 from typing_extensions import Protocol
 
@@ -25,6 +27,15 @@ from .errors import DIError
 
 _T = TypeVar("_T", covariant=True)
 
+#: The max number of distinct function shapes whose parameters are
+#: cached by _get_parameters.
+_FUNCTION_PARAMETERS_CACHE_SIZE = 1024
+_function_parameters: Dict[Hashable, Iterable[Parameter]] = {}
+
+#: The max number of distinct parameters whose components each
+#: injector caches.
+_PARAMETER_COMPONENTS_CACHE_SIZE = 1024
+
 
 class Component(Protocol[_T]):  # pragma: no cover
     """The component protocol.
@@ -59,6 +70,8 @@ class Component(Protocol[_T]):  # pragma: no cover
 
     def can_handle_parameter(self, parameter: Parameter) -> bool:
         """Returns True when parameter represents the desired component.
+        The result must only depend on the parameter, because the
+        injector caches it.
         """
 
     @no_type_check
@@ -79,14 +92,20 @@ class DependencyInjector:
     __slots__ = [
         "components",
         "singletons",
+        "parameter_components",
+        "parameter_components_key",
     ]
 
     components: List[Component[Any]]
     singletons: Dict[Component[Any], Any]
+    parameter_components: Dict[Parameter, Optional[Component[Any]]]
+    parameter_components_key: List[Component[Any]]
 
     def __init__(self, components: List[Component[Any]], singletons: Optional[Dict[Component[Any], Any]] = None) -> None:
         self.components = components or []
         self.singletons = singletons or {}
+        self.parameter_components = {}
+        self.parameter_components_key = self.components[:]
 
         def is_singleton(component: Component[Any]) -> bool:
             return getattr(component, "is_singleton", False) and component not in self.singletons
@@ -109,9 +128,17 @@ class DependencyInjector:
     def get_resolver(self, instances: Optional[Dict[Any, Any]] = None) -> "DependencyResolver":
         """Get the resolver for this Injector.
         """
+        # The cached parameter lookups are only valid for the set of
+        # components they were made against so they're dropped
+        # whenever the components list is changed.
+        if self.components != self.parameter_components_key:
+            self.parameter_components.clear()
+            self.parameter_components_key = self.components[:]
+
         return DependencyResolver(
             self.components,
             {**self.singletons, **(instances or {})},
+            self.parameter_components,
         )
 
 
@@ -123,12 +150,26 @@ class DependencyResolver:
     __slots__ = [
         "components",
         "instances",
+        "parameter_components",
+        "cached_components_count",
     ]
 
-    def __init__(self, components: List[Component[Any]], instances: Dict[Component[Any], Any]) -> None:
+    def __init__(
+            self,
+            components: List[Component[Any]],
+            instances: Dict[Component[Any], Any],
+            parameter_components: Optional[Dict[Parameter, Optional[Component[Any]]]] = None,
+    ) -> None:
         self.components = components[:]
         self.instances = instances
 
+        # Lookups against the initial set of components are cached in
+        # parameter_components, which is shared between all of an
+        # injector's resolvers.  Components that are added later are
+        # request-specific so they are always checked.
+        self.parameter_components = parameter_components if parameter_components is not None else {}
+        self.cached_components_count = len(components)
+
     def add_component(self, component: Component[Any]) -> None:
         """Add a component to this resolver without adding it to the
         base dependency injector.  This is useful for runtime-built
@@ -136,6 +177,27 @@ class DependencyResolver:
         """
         self.components.append(component)
 
+    def find_component(self, parameter: Parameter) -> Optional[Component[Any]]:
+        """Find the first component that can handle the given parameter.
+        """
+        cached_components = islice(self.components, self.cached_components_count)
+        try:
+            component = self.parameter_components[parameter]
+        except KeyError:
+            component = _find_component(cached_components, parameter)
+            if len(self.parameter_components) >= _PARAMETER_COMPONENTS_CACHE_SIZE:
+                self.parameter_components.clear()
+
+            self.parameter_components[parameter] = component
+        except TypeError:  # The parameter's default value is unhashable.
+            component = _find_component(cached_components, parameter)
+
+        if component is None:
+            added_components = islice(self.components, self.cached_components_count, None)
+            component = _find_component(added_components, parameter)
+
+        return component
+
     def resolve(
             self,
             fn: Callable[..., Any],
@@ -173,28 +235,59 @@ class DependencyResolver:
                 except KeyError:
                     pass
 
-                for component in self.components:
-                    if component.can_handle_parameter(parameter):
-                        try:
-                            params[parameter.name] = self.instances[component]
-                        except KeyError:
-                            factory = self.resolve(component.resolve, resolving_parameter=parameter)
-                            params[parameter.name] = instance = factory()
+                component = self.find_component(parameter)
+                if component is None:
+                    raise DIError(f"cannot resolve parameter {parameter} of function {fn}")
 
-                            if getattr(component, "is_cacheable", True):
-                                self.instances[component] = instance
+                try:
+                    params[parameter.name] = self.instances[component]
+                except KeyError:
+                    factory = self.resolve(component.resolve, resolving_parameter=parameter)
+                    params[parameter.name] = instance = factory()
 
-                        break
-                else:
-                    raise DIError(f"cannot resolve parameter {parameter} of function {fn}")
+                    if getattr(component, "is_cacheable", True):
+                        self.instances[component] = instance
 
             return fn(**params)
 
         return resolved_fn
 
 
-@functools.lru_cache(maxsize=128)
+def _find_component(components: Iterable[Component[Any]], parameter: Parameter) -> Optional[Component[Any]]:
+    for component in components:
+        if component.can_handle_parameter(parameter):
+            return component
+    return None
+
+
 def _get_parameters(fn: Callable[..., Any]) -> Iterable[Parameter]:
+    # Middleware create new closures on every request so caching
+    # their params by identity would never hit.  A plain function's
+    # signature only depends on its code, defaults and annotations
+    # so those are used as the cache key instead.
+    if type(fn) is not FunctionType or "__wrapped__" in fn.__dict__ or "__signature__" in fn.__dict__:
+        return _get_callable_parameters(fn)
+
+    try:
+        key = (
+            fn.__code__,
+            fn.__defaults__,
+            fn.__kwdefaults__ and tuple(fn.__kwdefaults__.items()),
+            tuple(fn.__annotations__.items()),
+        )
+        return _function_parameters[key]
+    except TypeError:  # Some default or annotation is unhashable.
+        return _get_callable_parameters(fn)
+    except KeyError:
+        if len(_function_parameters) >= _FUNCTION_PARAMETERS_CACHE_SIZE:
+            _function_parameters.clear()
+
+        parameters = _function_parameters[key] = signature(fn).parameters.values()
+        return parameters
+
+
+@functools.lru_cache(maxsize=128)
+def _get_callable_parameters(fn: Callable[..., Any]) -> Iterable[Parameter]:
     # A significant amount of time is spent getting handlers' params.
     # Since they never change, it should be safe to just cache 'em.
     return signature(fn).parameters.values()
@@ -87,6 +87,11 @@ class Headers(Iterable[Tuple[str, str]]):
         except HeaderMissing:
             return default
 
+    def __contains__(self, header: object) -> bool:
+        """Returns True when the header has at least one value.
+        """
+        return isinstance(header, str) and bool(self._headers.get(header.lower()))
+
     def __delitem__(self, header: str) -> None:
         """Delete all the values for a given header.
         """
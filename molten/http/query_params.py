@@ -58,5 +58,5 @@ class QueryParams(MultiDict[str, str]):
         """
         try:
             return self._data[name][-1]
-        except IndexError:
+        except (IndexError, KeyError):
             raise ParamMissing(name)
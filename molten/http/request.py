@@ -43,8 +43,9 @@ class Request:
         "host",
         "port",
         "path",
-        "params",
         "headers",
+        "_params",
+        "_query_string",
         "body_file",
     ]
 
@@ -65,33 +66,47 @@ class Request:
         self.port = port
         self.path = path
         self.body_file = body_file or BytesIO()
+        self._query_string = ""
 
         if isinstance(headers, dict):
             self.headers: Headers = Headers(headers)
         else:
             self.headers = headers or Headers()
 
+        self._params: Optional[QueryParams]
         if not params:
-            self.params = QueryParams()
+            self._params = None
         elif isinstance(params, dict):
-            self.params = QueryParams(params)
+            self._params = QueryParams(params)
         else:
-            self.params = params
+            self._params = params
 
     @classmethod
     def from_environ(cls, environ: Environ) -> "Request":
-        """Construct a Request object from a WSGI environ.
+        """Construct a Request object from a WSGI environ.  The query
+        string is only parsed once the request's params are accessed.
         """
-        return Request(
+        request = Request(
             method=environ["REQUEST_METHOD"],
             scheme=environ["wsgi.url_scheme"],
             host=environ.get("HTTP_HOST", ""),
             port=environ.get("SERVER_PORT", 0),
             path=environ.get("PATH_INFO", ""),
-            params=QueryParams.from_environ(environ),
             headers=Headers.from_environ(environ),
             body_file=environ["wsgi.input"],
         )
+        request._query_string = environ.get("QUERY_STRING", "")
+        return request
+
+    @property
+    def params(self) -> QueryParams:
+        if self._params is None:
+            self._params = QueryParams.parse(self._query_string)
+        return self._params
+
+    @params.setter
+    def params(self, params: QueryParams) -> None:
+        self._params = params
 
     def __repr__(self) -> str:
         return (
@@ -65,21 +65,25 @@ class Response:
     def get_content_length(self) -> Optional[int]:
         """Compute the content length of this response.
         """
-        content_length = self.headers.get_int("content-length")
-        if content_length is None:
+        if "content-length" in self.headers:
+            return self.headers.get_int("content-length")
+
+        # In-memory streams know their size so there's no need to go
+        # through fileno(), which always raises for them.
+        if type(self.stream) is io.BytesIO:
+            return len(self.stream.getvalue())  # type: ignore
+
+        try:
+            stream_stat = os.fstat(self.stream.fileno())
+            return stream_stat.st_size
+        except OSError:
+            old_position = self.stream.tell()
+
             try:
-                stream_stat = os.fstat(self.stream.fileno())
-                content_length = stream_stat.st_size
-            except OSError:
-                old_position = self.stream.tell()
-
-                try:
-                    self.stream.seek(0, os.SEEK_END)
-                    content_length = self.stream.tell()
-                finally:
-                    self.stream.seek(old_position, os.SEEK_SET)
-
-        return content_length
+                self.stream.seek(0, os.SEEK_END)
+                return self.stream.tell()
+            finally:
+                self.stream.seek(old_position, os.SEEK_SET)
 
     def set_cookie(self, cookie: Cookie) -> None:
         """Add a cookie to this response.
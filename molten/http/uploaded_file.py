@@ -15,11 +15,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 from shutil import copyfileobj
-from typing import Any, BinaryIO, Union
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Optional, Union
 
 from .headers import Headers
 
+#: The max number of bytes to copy per copy_file_range call.
+COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class UploadedFile:
     """Represents a file that was uploaded as part of an HTTP request.
@@ -45,10 +50,14 @@ class UploadedFile:
 
     def save(self, destination: Union[str, BinaryIO]) -> None:
         """Save the file's contents either to another file object or to a path on disk.
+
+        When saving to a path, files that are backed by real files on
+        disk are copied directly within the kernel where supported.
         """
         if isinstance(destination, str):
             with open(destination, "wb+") as outfile:
-                copyfileobj(self.stream, outfile)
+                if not _copy_file_range(self.stream, outfile):
+                    copyfileobj(self.stream, outfile)
 
         else:
             copyfileobj(self.stream, destination)
@@ -59,3 +68,43 @@ class UploadedFile:
     def __repr__(self) -> str:
         params = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
         return f"UploadedFile({params})"
+
+
+def _get_fileno(stream: BinaryIO) -> Optional[int]:
+    # Calling fileno() on a spooled file moves its contents to disk so
+    # it's better to avoid it for files that are still in memory.
+    if isinstance(stream, SpooledTemporaryFile) and not stream._rolled:  # type: ignore
+        return None
+
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _copy_file_range(source: BinaryIO, destination: BinaryIO) -> bool:
+    copy_file_range = getattr(os, "copy_file_range", None)
+    source_fd, destination_fd = _get_fileno(source), _get_fileno(destination)
+    if copy_file_range is None or source_fd is None or destination_fd is None:
+        return False
+
+    # The source may have read ahead of its logical position so the
+    # offset has to be passed explicitly.
+    try:
+        offset = source.tell()
+    except (AttributeError, OSError):
+        return False
+
+    try:
+        copied = copy_file_range(source_fd, destination_fd, COPY_CHUNK_SIZE, offset)
+        while copied:
+            offset += copied
+            copied = copy_file_range(source_fd, destination_fd, COPY_CHUNK_SIZE, offset)
+    except OSError:
+        # Whatever was copied so far has advanced the destination so
+        # the caller can pick up where this left off.
+        source.seek(offset)
+        return False
+
+    source.seek(offset)
+    return True
@@ -87,6 +87,12 @@ class Include:
         self.namespace = namespace
 
 
+#: A regular expression that matches any of a set of routes, along
+#: with a mapping from the name of each route's outermost group to the
+#: route and the names of the groups that hold its params.
+_RouteMatcher = Tuple[Pattern[str], Dict[str, Tuple[Route, List[Tuple[str, str]]]]]
+
+
 class Router:
     """A collection of routes.
     """
@@ -94,13 +100,13 @@ class Router:
     __slots__ = [
         "_routes_by_name",
         "_routes_by_method",
-        "_route_res_by_method",
+        "_matchers_by_method",
     ]
 
     def __init__(self, routes: Optional[List[RouteLike]] = None) -> None:
         self._routes_by_name: Dict[str, Route] = {}
         self._routes_by_method: Dict[str, List[Route]] = defaultdict(list)
-        self._route_res_by_method: Dict[str, List[Pattern[str]]] = defaultdict(list)
+        self._matchers_by_method: Dict[str, _RouteMatcher] = {}
         self.add_routes(routes or [])
 
     def add_route(self, route_like: RouteLike, prefix: str = "", namespace: Optional[str] = None) -> None:
@@ -130,7 +136,7 @@ class Router:
 
             self._routes_by_name[route_name] = route
             self._routes_by_method[route.method].insert(0, route)
-            self._route_res_by_method[route.method].insert(0, compile_route_template(route.template))
+            self._matchers_by_method.pop(route.method, None)
 
         else:  # pragma: no cover
             raise NotImplementedError(f"unhandled type {type(route_like)}")
@@ -146,14 +152,22 @@ class Router:
         Returns the route and any path params that were extracted from
         the path.
         """
-        routes = self._routes_by_method[method]
-        route_res = self._route_res_by_method[method]
-        for route, route_re in zip(routes, route_res):
-            match = route_re.match(path)
-            if match is not None:
-                return route, match.groupdict()
+        try:
+            matcher = self._matchers_by_method[method]
+        except KeyError:
+            routes = self._routes_by_method.get(method)
+            if not routes:
+                return None
+
+            matcher = self._matchers_by_method[method] = _compile_route_matcher(routes)
+
+        route_re, routes_by_group = matcher
+        match = route_re.match(path)
+        if match is None:
+            return None
 
-        return None
+        route, param_groups = routes_by_group[match.lastgroup]
+        return route, {param: match.group(group) for param, group in param_groups}
 
     def reverse_uri(self, route_name: str, **params: str) -> str:
         """Build a URI from a Route.
@@ -188,13 +202,35 @@ class Router:
 def compile_route_template(template: str) -> Pattern[str]:
     """Convert a route template into a regular expression.
     """
+    return re.compile(_route_template_to_re(template))
+
+
+def _compile_route_matcher(routes: List[Route]) -> _RouteMatcher:
+    # Alternatives are tried in order so the routes' priorities are
+    # preserved.  Group names are prefixed to avoid clashes between
+    # routes that have params with the same name.
+    alternatives = []
+    routes_by_group = {}
+    for i, route in enumerate(routes):
+        route_group, group_prefix = f"r{i}", f"r{i}_"
+        alternatives.append(f"(?P<{route_group}>{_route_template_to_re(route.template, group_prefix)})")
+        routes_by_group[route_group] = route, [
+            (token, group_prefix + token)
+            for kind, token in tokenize_route_template(route.template)
+            if kind == "binding" or kind == "glob"
+        ]
+
+    return re.compile("|".join(alternatives)), routes_by_group
+
+
+def _route_template_to_re(template: str, group_prefix: str = "") -> str:
     re_template = ""
     for kind, token in tokenize_route_template(template):
         if kind == "binding":
-            re_template += f"(?P<{token}>[^/]+)"
+            re_template += f"(?P<{group_prefix}{token}>[^/]+)"
 
         elif kind == "glob":
-            re_template += f"(?P<{token}>.+)"
+            re_template += f"(?P<{group_prefix}{token}>.+)"
 
         elif kind == "chunk":
             re_template += token.replace(".", r"\.")
@@ -202,7 +238,7 @@ def compile_route_template(template: str) -> Pattern[str]:
         else:  # pragma: no cover
             raise NotImplementedError(f"unhandled token kind {kind!r}")
 
-    return re.compile(f"^{re_template}$")
+    return f"^{re_template}$"
 
 
 def tokenize_route_template(template: str) -> Iterator[Tuple[str, str]]:
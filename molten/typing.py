@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 from typing import Any, BinaryIO, Callable, Dict, List, NewType, Tuple, Union, no_type_check
 
 import typing_inspect
@@ -87,6 +88,16 @@ def extract_optional_annotation(annotation: Any) -> Tuple[bool, Any]:
     """Returns a tuple denoting whether or not the annotation is an
     Optional type and the inner annotation.
     """
+    # Components call this for their parameters on every request so
+    # the results are memoized.  Unhashable annotations are rare
+    # enough that they're just recomputed every time.
+    try:
+        return _extract_optional_annotation_cached(annotation)
+    except TypeError:
+        return _extract_optional_annotation(annotation)
+
+
+def _extract_optional_annotation(annotation: Any) -> Tuple[bool, Any]:
     if typing_inspect.is_union_type(annotation):
         args = get_args(annotation)
         inner = [arg for arg in args if not isinstance(arg, type) or not issubclass(arg, type(None))]
@@ -95,6 +106,9 @@ def extract_optional_annotation(annotation: Any) -> Tuple[bool, Any]:
     return False, annotation
 
 
+_extract_optional_annotation_cached = lru_cache(maxsize=1024)(_extract_optional_annotation)
+
+
 def is_optional_annotation(annotation: Any) -> bool:
     """Returns True if the given annotation represents an Optional type.
     """
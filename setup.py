@@ -53,7 +53,7 @@ extra_dependencies["dev"] = extra_dependencies["all"] + [
     "msgpack>0.5,<0.6",
     "prometheus-client>=0.2,<0.3",
     "sqlalchemy>1.2,<2.0",
-    "toml>0.9,<0.10",
+    "tomli>=1.2,<3.0; python_version < '3.11'",
     "wsgicors>=0.7,<0.8",
 
     # Testing
@@ -24,6 +24,7 @@ app = App(
 
     routes=[
         Route("/", index),
+        Route("/repeated", index, name="repeated"),
         Route("/bad-request", bad_request),
         Route("/exception", exception),
         Route("/metrics", expose_metrics),
@@ -97,3 +98,19 @@ def test_apps_can_track_metrics_for_builtin_endpoints():
     # And it should contain a metric for the first request
     assert 'http_requests_total{method="GET",path="/idontexist",status="404 Not Found"} 1.0' \
         in response.data
+
+
+def test_apps_can_track_metrics_for_repeated_requests():
+    # Given an app and a client
+    # When I visit an endpoint twice
+    client.get("/repeated")
+    client.get("/repeated")
+
+    # And then visit the metrics endpoint
+    response = client.get("/metrics")
+
+    # Then the response should succeed
+    assert response.status_code == 200
+
+    # And it should count both requests
+    assert 'http_requests_total{method="GET",path="/repeated",status="200 OK"} 2.0' in response.data
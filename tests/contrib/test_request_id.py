@@ -1,5 +1,6 @@
 import logging
 import logging.config
+from uuid import UUID
 
 import pytest
 
@@ -88,6 +89,17 @@ def test_apps_generate_request_ids(handler):
         request_id = response.headers["x-request-id"]
 
 
+def test_apps_generate_uuid4_request_ids():
+    # Given that I have an app
+    # When I make a request w/o a request id header
+    response = client.get(app.reverse_uri("index"))
+
+    # Then the response's x-request-id header should be a UUID4
+    request_id = response.headers["x-request-id"]
+    assert UUID(request_id).version == 4
+    assert str(UUID(request_id)) == request_id
+
+
 def test_apps_propagate_request_ids(caplog):
     # Given that I have an app
     # When I make a request w/ a request id header
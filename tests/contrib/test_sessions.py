@@ -1,3 +1,4 @@
+import hmac
 from http import cookies
 from typing import Optional
 
@@ -125,3 +126,36 @@ def test_apps_session_cookies_expire():
 
     # Then I should get back nothing
     assert response.json() is None
+
+
+def test_cookie_stores_decode_cached_sessions_anew():
+    # Given that I have a cookie store and a cookie for a session
+    cookie_store = CookieStore(b"secret")
+    session = Session.empty()
+    session["items"] = []
+    cookie = cookie_store.dump(session)
+    cookies = {cookie.name: cookie.value}
+
+    # When I load that session and modify it
+    loaded_session = cookie_store.load(cookies)
+    loaded_session["items"].append(1)
+
+    # And I load it again from the same cookie
+    # Then I should get back the original session data
+    assert cookie_store.load(cookies)["items"] == []
+    assert cookie_store.load(cookies)["id"] == session["id"]
+
+    # When I tamper with that cookie
+    # Then I should get back an empty session
+    tampered_cookies = {cookie.name: cookie.value[:-1]}
+    assert cookie_store.load(tampered_cookies)["id"] != session["id"]
+
+
+def test_cookie_stores_sign_values_using_hmac():
+    # Given that I have a cookie store
+    store = CookieStore("secret", signing_method="sha1")
+
+    # When I sign a couple of values
+    # Then each signature should be the HMAC of that value
+    for value in [b"a", b"b"]:
+        assert store.sign(value) == hmac.new(b"secret", value, "sha1").hexdigest()
@@ -5,7 +5,8 @@ import pytest
 
 from molten import App, ResponseRendererMiddleware, Route, annotate
 from molten.contrib.websockets import (
-    CloseMessage, TextMessage, Websocket, WebsocketsMiddleware, WebsocketsTestClient
+    MAX_COALESCED_PAYLOAD_SIZE, BinaryMessage, CloseMessage, TextMessage, Websocket, WebsocketsMiddleware,
+    WebsocketsTestClient
 )
 
 
@@ -101,3 +102,65 @@ def test_ws_client_can_connect_to_websocket_endpoints():
         # Then I should get back a valid socket
         sock.send(TextMessage("hello"))
         assert sock.receive().get_text() == "hello"
+
+
+def test_ws_messages_can_be_encoded_up_front():
+    # Given that I have a text message
+    message = TextMessage("hello")
+
+    # When I encode it
+    data = message.encode()
+
+    # Then I should get back a single, final, unmasked text frame
+    assert data == b"\x81\x05hello"
+
+
+class RecordingStream:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+
+def test_ws_small_messages_are_written_in_one_call():
+    # Given that I have a small binary message
+    message = BinaryMessage(b"hello")
+
+    # When I write it to a stream
+    stream = RecordingStream()
+    message.to_stream(stream)
+
+    # Then its header and payload should be written together
+    assert stream.writes == [b"\x82\x05hello"]
+
+
+def test_ws_large_messages_are_written_without_copying_their_payloads():
+    # Given that I have a large binary message
+    payload = b"a" * MAX_COALESCED_PAYLOAD_SIZE
+    message = BinaryMessage(payload)
+
+    # When I write it to a stream
+    stream = RecordingStream()
+    message.to_stream(stream)
+
+    # Then its header and payload should be written separately
+    assert len(stream.writes) == 2
+    assert b"".join(stream.writes) == message.encode()
+
+    # And the payload should be written as-is
+    assert stream.writes[1] == payload
+
+
+def test_ws_encoded_messages_can_be_sent_many_times():
+    # Given that I have an encoded message
+    data = TextMessage("hello").encode()
+
+    # When I connect to the echo endpoint and send it twice
+    with client.connect("/echo") as sock:
+        sock.send_encoded(data)
+        sock.send_encoded(data)
+
+        # Then I should get it back twice
+        assert sock.receive().get_text() == "hello"
+        assert sock.receive().get_text() == "hello"
@@ -120,3 +120,20 @@ def test_headers_are_representable():
     # When I call repr on it
     # Then I should get back a syntactically-valid repr
     assert dict(eval(repr(headers))) == dict(headers)
+
+
+def test_headers_support_membership_tests():
+    # Given that I have a Headers instance with a header
+    headers = Headers({"Content-Type": "application/json"})
+
+    # When I check whether headers are present
+    # Then only the headers that have values should be found
+    assert "content-type" in headers
+    assert "CONTENT-TYPE" in headers
+    assert "content-length" not in headers
+
+    # When I look up all the values of a missing header
+    headers.get_all("x-missing")
+
+    # Then that header should still not be found
+    assert "x-missing" not in headers
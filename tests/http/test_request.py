@@ -1,4 +1,4 @@
-from molten import Request
+from molten import QueryParams, Request
 
 
 def test_requests_are_representable():
@@ -8,3 +8,26 @@ def test_requests_are_representable():
     # When I call repr on it
     # Then I should get back a valid repr
     assert repr(request)
+
+
+def test_requests_parse_query_strings_on_first_access():
+    # Given that I have a WSGI environ with a query string
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": None,
+        "QUERY_STRING": "x=1&x=2&y=3",
+    }
+
+    # When I construct a Request from it
+    request = Request.from_environ(environ)
+
+    # Then its params should contain the parsed query string
+    assert request.params.get_all("x") == ["1", "2"]
+    assert request.params["y"] == "3"
+
+    # When I replace its params
+    request.params = QueryParams({"z": "4"})
+
+    # Then the new params should be used
+    assert request.params["z"] == "4"
@@ -36,3 +36,22 @@ def test_responses_get_content_length_does_not_change_the_streams_position():
     # And read one byte again
     # Then it should pick up where it left off
     assert response.stream.read(1) == b"B"
+
+
+def test_responses_get_content_length_prefers_explicit_headers():
+    # Given that I have a Response instance with an explicit content-length
+    response = Response(HTTP_200, content="ABCD", headers={"content-length": "2"})
+
+    # When I get its content length
+    # Then I should get back the value of the header
+    assert response.get_content_length() == 2
+
+
+def test_responses_get_content_length_of_written_streams():
+    # Given that I have a Response instance whose stream was written to
+    response = Response(HTTP_200)
+    response.stream.write("ABCDEF".encode())
+
+    # When I get its content length
+    # Then I should get back the size of the data
+    assert response.get_content_length() == 6
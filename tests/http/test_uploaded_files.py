@@ -1,6 +1,11 @@
+import os
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
+
+import pytest
 
 from molten import Headers, UploadedFile
+from molten.http import uploaded_file as uploaded_file_module
 
 
 def test_uploaded_files_are_representable():
@@ -35,3 +40,49 @@ def test_uploaded_files_can_be_saved_to_paths():
     # Then the data should be copied to that file
     with open(filename, "rb") as f:
         assert f.read() == b"data"
+
+
+def test_uploaded_files_backed_by_real_files_can_be_saved_to_paths():
+    # Given that I have an uploaded file that has been spooled to disk
+    stream = SpooledTemporaryFile(max_size=1)
+    stream.write(b"skip" + b"data" * 1024)
+    stream.seek(4)
+    uploaded_file = UploadedFile("a.txt", Headers(), stream)
+
+    # When I save it to a path on disk
+    filename = "tests/http/fixtures/uploaded_file_output"
+    uploaded_file.save(filename)
+
+    # Then the data from its current position onward should be copied to that file
+    with open(filename, "rb") as f:
+        assert f.read() == b"data" * 1024
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+def test_uploaded_files_fall_back_to_copying_when_copy_file_range_fails_midway(monkeypatch):
+    # Given that copy_file_range fails after copying part of a file
+    copy_file_range, calls = os.copy_file_range, []
+
+    def flaky_copy_file_range(*args):
+        calls.append(args)
+        if len(calls) > 1:
+            raise OSError("copy failed")
+        return copy_file_range(*args)
+
+    monkeypatch.setattr(os, "copy_file_range", flaky_copy_file_range)
+    monkeypatch.setattr(uploaded_file_module, "COPY_CHUNK_SIZE", 4)
+
+    # And an uploaded file that has been spooled to disk
+    stream = SpooledTemporaryFile(max_size=1)
+    stream.write(b"data" * 1024)
+    stream.seek(0)
+    uploaded_file = UploadedFile("a.txt", Headers(), stream)
+
+    # When I save it to a path on disk
+    filename = "tests/http/fixtures/uploaded_file_output"
+    uploaded_file.save(filename)
+
+    # Then all of its data should still be copied to that file
+    assert len(calls) == 2
+    with open(filename, "rb") as f:
+        assert f.read() == b"data" * 1024
@@ -218,6 +218,19 @@ def test_complex_apps_can_return_openapi_document():
         assert response.json() == json.load(f)
 
 
+def test_openapi_handlers_return_cached_documents():
+    # Given that I have a complex app
+    # When I call its schema handler twice
+    resolver = app.injector.get_resolver()
+    document = resolver.resolve(get_schema)()
+
+    # Then I should get back the document as a dict
+    assert isinstance(document, dict)
+
+    # And the same document should be returned on subsequent calls
+    assert resolver.resolve(get_schema)() is document
+
+
 def test_complex_apps_can_render_the_swagger_ui():
     # Given that I have a complex app
     # When I visit its docs uri
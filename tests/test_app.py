@@ -565,3 +565,33 @@ def test_uploaded_files_can_have_a_content_type():
     assert response.status_code == 200
     # And the response should contain the content type
     assert response.json() == "text/plain"
+
+
+def test_apps_return_in_memory_responses_in_a_single_chunk():
+    # Given that I have an app and a WSGI environ for its index route
+    environ = testing.to_environ(Request(path="/"))
+
+    # When I call the app directly
+    chunks = app(environ, lambda status, headers, exc_info=None: None)
+
+    # Then I should get back the whole response in a single chunk
+    assert chunks == [b"Hello!"]
+
+
+def test_apps_dont_duplicate_explicit_content_lengths():
+    # Given that I have an app with a handler that sets its own content-length
+    def handler() -> Response:
+        return Response(HTTP_200, content="hi", headers={"content-length": "2"})
+
+    app = App(routes=[Route("/", handler)])
+
+    # When I call the app
+    headers = []
+
+    def start_response(status, response_headers, exc_info=None):
+        headers.extend(response_headers)
+
+    app(testing.to_environ(Request(path="/")), start_response)
+
+    # Then the content-length header should only be sent once
+    assert headers == [("content-length", "2")]
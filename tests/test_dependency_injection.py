@@ -4,7 +4,7 @@ from typing import NewType
 
 import pytest
 
-from molten import DependencyInjector, DIError
+from molten import DependencyInjector, DIError, dependency_injection
 
 
 class Settings(dict):
@@ -151,3 +151,117 @@ def test_di_correctly_instantiates_singleton_dependencies(component_classes):
     assert db_2 is db_1
     assert metrics_2 is metrics_1
     assert settings_2 is settings_1
+
+
+def test_di_caches_component_lookups_across_resolvers():
+    # Given that I have a DI instance whose component counts lookups
+    lookups = []
+
+    class CountingSettingsComponent(SettingsComponent):
+        def can_handle_parameter(self, parameter: Parameter) -> bool:
+            lookups.append(parameter)
+            return super().can_handle_parameter(parameter)
+
+    di = DependencyInjector(components=[CountingSettingsComponent()])
+
+    # And a function that uses DI
+    def example(settings: Settings):
+        return settings
+
+    # When I resolve that function using two different resolvers
+    settings_1 = di.get_resolver().resolve(example)()
+    settings_2 = di.get_resolver().resolve(example)()
+
+    # Then the component should only have been looked up once
+    assert settings_1 is settings_2
+    assert len(lookups) == 1
+
+
+def test_di_always_checks_components_added_to_resolvers():
+    # Given that I have a DI instance
+    di = DependencyInjector(components=[SettingsComponent()])
+
+    # And a function that uses DI
+    def example(metrics: Metrics):
+        return metrics
+
+    # When I resolve that function using a resolver without a metrics component
+    # Then a DIError should be raised
+    with pytest.raises(DIError):
+        di.get_resolver().resolve(example)()
+
+    # When I resolve that function using a resolver with a metrics component
+    resolver = di.get_resolver()
+    resolver.add_component(MetricsComponent())
+
+    # Then the metrics component should be used
+    assert isinstance(resolver.resolve(example)(), Metrics)
+
+
+def test_di_checks_components_added_to_the_injector_after_lookups_are_cached():
+    # Given that I have a DI instance
+    di = DependencyInjector(components=[SettingsComponent()])
+
+    # And a function that uses DI
+    def example(metrics: Metrics):
+        return metrics
+
+    # When I resolve that function before a metrics component is registered
+    # Then a DIError should be raised
+    with pytest.raises(DIError):
+        di.get_resolver().resolve(example)()
+
+    # When I register a metrics component with the injector
+    di.components.append(MetricsComponent())
+
+    # Then the metrics component should be used
+    assert isinstance(di.get_resolver().resolve(example)(), Metrics)
+
+
+def test_di_bounds_its_component_lookup_cache(monkeypatch):
+    # Given that the component lookup cache can hold two parameters
+    monkeypatch.setattr(dependency_injection, "_PARAMETER_COMPONENTS_CACHE_SIZE", 2)
+
+    # And I have a DI instance
+    di = DependencyInjector(components=[SettingsComponent()])
+
+    # And three functions with distinct parameters
+    def example_1(a: Settings):
+        return a
+
+    def example_2(b: Settings):
+        return b
+
+    def example_3(c: Settings):
+        return c
+
+    # When I resolve all three functions
+    for example in [example_1, example_2, example_3]:
+        di.get_resolver().resolve(example)()
+
+    # Then the cache should never hold more than two parameters
+    assert len(di.parameter_components) <= 2
+
+
+def test_di_resolves_closures_created_from_the_same_function():
+    # Given that I have a DI instance
+    di = DependencyInjector(components=[SettingsComponent(), MetricsComponent()])
+
+    # And a function that creates closures whose annotations vary
+    def make_example(annotation):
+        def example(dep: annotation):
+            return dep
+        return example
+
+    # When I resolve closures with different annotations
+    resolver = di.get_resolver()
+    settings = resolver.resolve(make_example(Settings))()
+    metrics = resolver.resolve(make_example(Metrics))()
+
+    # Then each of them should get its own dependency
+    assert isinstance(settings, Settings)
+    assert isinstance(metrics, Metrics)
+
+    # When I resolve another closure with a previously-seen annotation
+    # Then it should get the same dependency
+    assert resolver.resolve(make_example(Settings))() is settings
@@ -37,3 +37,15 @@ def test_multidict_getitem_raises_keyerror():
     # Then a KeyError should be raised
     with pytest.raises(KeyError):
         md["x"]
+
+
+def test_multidict_get_all_does_not_add_missing_keys():
+    # Given that I have an empty multidict
+    md = MultiDict()
+
+    # When I get_all() a key that doesn't exist
+    # Then I should get back an empty list
+    assert md.get_all("x") == []
+
+    # And that key should not show up in the multidict
+    assert list(md) == []
@@ -135,3 +135,40 @@ def test_route_template_compiler(template, path, expected):
         assert match is None
     else:
         assert match.groupdict() == expected
+
+
+def test_router_matches_routes_in_priority_order():
+    # Given that I have a router with overlapping routes whose params share names
+    router = Router([
+        Route("/users/me", handler, name="get_me"),
+        Route("/users/{id}", handler, name="get_user"),
+        Route("/users/{id}/posts/{*path}", handler, name="get_user_post"),
+        Route("/posts/{id}", handler, name="get_post"),
+        Route("/users/{id}", handler, method="DELETE", name="delete_user"),
+    ])
+
+    # When I match paths against it
+    # Then routes added later should take precedence
+    route, params = router.match("GET", "/users/me")
+    assert (route.name, params) == ("get_user", {"id": "me"})
+
+    # And each route's params should be extracted
+    route, params = router.match("GET", "/users/1/posts/a/b")
+    assert (route.name, params) == ("get_user_post", {"id": "1", "path": "a/b"})
+
+    route, params = router.match("GET", "/posts/2")
+    assert (route.name, params) == ("get_post", {"id": "2"})
+
+    route, params = router.match("DELETE", "/users/3")
+    assert (route.name, params) == ("delete_user", {"id": "3"})
+
+    # When I add a route after matching
+    router.add_route(Route("/users/me", handler, name="get_me_again"))
+
+    # Then it should be matched
+    route, params = router.match("GET", "/users/me")
+    assert (route.name, params) == ("get_me_again", {})
+
+    # When I match a method that has no routes
+    # Then I should get back None
+    assert router.match("PATCH", "/users/1") is None